@@ -14,17 +14,84 @@ from typing import Any
 from typing import Generator
 
 import pytest
+from hypothesis import HealthCheck
+from hypothesis import Phase
+from hypothesis import settings
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
+# ---------------------------------------------------------------------------
+# Hypothesis Profiles
+# ---------------------------------------------------------------------------
+
+# Deterministic, database-free profile for CI runs (HYPOTHESIS_PROFILE=ci)
+settings.register_profile(
+    "ci",
+    derandomize=True,
+    database=None,
+    deadline=None,
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+
+# Default profile for local development
+settings.register_profile(
+    "dev",
+    max_examples=100,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+
+# Development profile without the on-disk example database (HYPOTHESIS_PROFILE=perf)
+settings.register_profile(
+    "perf",
+    parent=settings.get_profile("dev"),
+    database=None,
+    print_blob=False,
+)
+
+# Extended profile for scheduled runs (HYPOTHESIS_PROFILE=nightly)
+settings.register_profile(
+    "nightly",
+    deadline=None,
+    max_examples=500,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+
+# Quick local profile, selected with PYTEST_FAST=1: the ci profile without the
+# shrink phase, so a failing property reports its first counterexample unshrunk.
+# Tests that pin max_examples in their own @settings keep that count.
+settings.register_profile(
+    "fast",
+    parent=settings.get_profile("ci"),
+    max_examples=10,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+
+# An explicit HYPOTHESIS_PROFILE takes precedence over PYTEST_FAST
+_default_profile = "fast" if os.getenv("PYTEST_FAST") == "1" else "dev"
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", _default_profile))
+
+
+def pytest_configure(config):
+    """Register Hypothesis type strategies once per session, before collection."""
+    from hypothesis import strategies as st
+
+    from farmer_cli.services.ytdlp_wrapper import VideoFormat
+
+    from .property._strategies import VIDEO_FORMAT
+
+    st.register_type_strategy(VideoFormat, VIDEO_FORMAT)
+
+
 # ---------------------------------------------------------------------------
 # Database Fixtures
 # ---------------------------------------------------------------------------
@@ -36,15 +103,47 @@ def temp_db_path(tmp_path: Path) -> Path:
     return tmp_path / "test_cli_app.db"
 
 
-@pytest.fixture
-def db_engine(temp_db_path: Path):
-    """Create a temporary SQLite database engine."""
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Create an in-memory SQLite engine shared by the whole test session.
+
+    StaticPool keeps the single in-memory connection alive, and the schema is
+    created once; db_session rolls back each test's writes. Under pytest-xdist
+    every worker process builds its own engine, so workers never share a
+    database.
+    """
+    from farmer_cli.models.base import Base
+
+    # Import all models to ensure they are registered
+    from farmer_cli.models import DownloadHistory  # noqa: F401
+    from farmer_cli.models import QueueItem  # noqa: F401
+    from farmer_cli.models import User  # noqa: F401
+
     engine = create_engine(
-        f"sqlite:///{temp_db_path}",
+        "sqlite://",
         echo=False,
         future=True,
-        poolclass=NullPool,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        insertmanyvalues_page_size=1000,
+        query_cache_size=500,
     )
+
+    # pysqlite defers BEGIN and breaks SAVEPOINT; let SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # Create all tables
+    Base.metadata.create_all(engine)
+
     try:
         yield engine
     finally:
@@ -54,19 +153,22 @@ def db_engine(temp_db_path: Path):
 
 @pytest.fixture
 def db_session(db_engine) -> Generator[Session, None, None]:
-    """Provide a database session with automatic cleanup."""
-    from farmer_cli.models.base import Base
+    """
+    Provide a database session whose changes are rolled back after the test.
 
-    # Import all models to ensure they are registered
-    from farmer_cli.models import DownloadHistory  # noqa: F401
-    from farmer_cli.models import QueueItem  # noqa: F401
-    from farmer_cli.models import User  # noqa: F401
-
-    # Create all tables
-    Base.metadata.create_all(db_engine)
+    The session is bound to a single connection inside an outer transaction.
+    Session commits only release SAVEPOINTs, so the outer rollback discards
+    everything the test wrote.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
 
     # Use scoped_session for proper cleanup
-    session_factory = sessionmaker(bind=db_engine, expire_on_commit=False)
+    session_factory = sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     ScopedSession = scoped_session(session_factory)
     session = ScopedSession()
 
@@ -76,6 +178,8 @@ def db_session(db_engine) -> Generator[Session, None, None]:
         session.rollback()
         session.expunge_all()
         ScopedSession.remove()  # Properly remove scoped session
+        transaction.rollback()
+        connection.close()
         gc.collect()  # Force garbage collection to close any lingering connections
 
 
@@ -0,0 +1,58 @@
+"""
+Hypothesis strategies shared by the property tests.
+
+VIDEO_FORMAT is registered for st.from_type(VideoFormat) in tests/conftest.py.
+"""
+
+import string
+
+from hypothesis import strategies as st
+
+from farmer_cli.services.ytdlp_wrapper import VideoFormat
+
+
+# Characters allowed in generated user names
+NAME_ALPHABET = string.ascii_letters + string.digits + " -_."
+
+# Strategy for generating valid user names (non-empty, ≤255 characters)
+# The first character is never a space, so no draw is whitespace-only
+VALID_NAME = st.builds(
+    str.__add__,
+    st.sampled_from(NAME_ALPHABET.replace(" ", "")),
+    st.text(alphabet=NAME_ALPHABET, max_size=254),
+)
+
+# Strategy for generating valid format IDs
+FORMAT_ID = st.text(
+    alphabet=string.ascii_letters + string.digits + "-_",
+    min_size=1,
+    max_size=20,
+)
+
+# Strategy for generating valid extensions
+EXTENSION = st.sampled_from([
+    "mp4", "webm", "mkv", "avi", "mov", "flv", "m4v", "m4a", "mp3", "ogg", "opus", "wav"
+])
+
+# Strategy for generating valid VideoFormat instances
+VIDEO_FORMAT = st.builds(
+    VideoFormat,
+    format_id=FORMAT_ID,
+    extension=EXTENSION,
+    resolution=st.one_of(
+        st.none(),
+        st.sampled_from(["144p", "240p", "360p", "480p", "720p", "1080p", "1440p", "2160p"]),
+    ),
+    filesize=st.one_of(st.none(), st.integers(min_value=1, max_value=10 * 1024 * 1024 * 1024)),  # Up to 10GB
+    codec=st.one_of(
+        st.none(),
+        st.sampled_from(["h264", "h265", "vp9", "av1", "aac", "opus", "mp3", "vorbis"]),
+    ),
+    is_audio_only=st.booleans(),
+    quality=st.integers(min_value=0, max_value=4320),
+    fps=st.one_of(st.none(), st.integers(min_value=1, max_value=120)),
+    vcodec=st.one_of(st.none(), st.sampled_from(["h264", "h265", "vp9", "av1"])),
+    acodec=st.one_of(st.none(), st.sampled_from(["aac", "opus", "mp3", "vorbis"])),
+    abr=st.one_of(st.none(), st.floats(min_value=32, max_value=320)),
+    vbr=st.one_of(st.none(), st.floats(min_value=100, max_value=50000)),
+)
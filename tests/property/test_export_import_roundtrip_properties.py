@@ -10,6 +10,7 @@ then importing SHALL preserve all data fields and produce equivalent records.
 """
 
 import json
+import os
 import string
 import tempfile
 from datetime import datetime
@@ -100,6 +101,23 @@ history_data_strategy = st.fixed_dictionaries({
 })
 
 
+# ---------------------------------------------------------------------------
+# Helper Functions
+# ---------------------------------------------------------------------------
+
+
+def _mkpath(suffix: str) -> Path:
+    """
+    Create an empty temporary file and return its path.
+
+    Uses mkstemp directly so no NamedTemporaryFile wrapper or finalizer is
+    created for every example; callers remain responsible for unlinking.
+    """
+    fd, name = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return Path(name)
+
+
 # ---------------------------------------------------------------------------
 # Test Fixtures
 # ---------------------------------------------------------------------------
@@ -107,8 +125,7 @@ history_data_strategy = st.fixed_dictionaries({
 @pytest.fixture
 def temp_db():
     """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = Path(f.name)
+    db_path = _mkpath(".db")
 
     engine = create_engine(f"sqlite:///{db_path}", echo=False)
     Base.metadata.create_all(engine)
@@ -153,10 +170,8 @@ class TestExportImportRoundTrip:
         database SHALL produce equivalent user records.
         """
         # Create temporary database and files
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as db_file:
-            db_path = Path(db_file.name)
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as json_file:
-            export_path = Path(json_file.name)
+        db_path = _mkpath(".db")
+        export_path = _mkpath(".json")
 
         try:
             # Setup first database with users
@@ -241,10 +256,8 @@ class TestExportImportRoundTrip:
         a fresh database SHALL produce equivalent history records.
         """
         # Create temporary database and files
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as db_file:
-            db_path = Path(db_file.name)
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as json_file:
-            export_path = Path(json_file.name)
+        db_path = _mkpath(".db")
+        export_path = _mkpath(".json")
 
         try:
             # Setup first database with history
@@ -381,8 +394,7 @@ class TestExportImportRoundTrip:
 
         For any exported data, the JSON file SHALL be valid JSON that can be parsed.
         """
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            export_path = Path(f.name)
+        export_path = _mkpath(".json")
 
         try:
             # Create export data
@@ -421,8 +433,7 @@ class TestExportImportRoundTrip:
 
         For any history data, all fields SHALL be preserved after export/import.
         """
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            export_path = Path(f.name)
+        export_path = _mkpath(".json")
 
         try:
             # Export to JSON
@@ -457,8 +468,7 @@ class TestExportImportRoundTrip:
 
         Exporting empty data SHALL produce a valid empty JSON array.
         """
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            export_path = Path(f.name)
+        export_path = _mkpath(".json")
 
         try:
             # Export empty list
@@ -484,10 +494,8 @@ class TestExportImportRoundTrip:
 
         For any data, performing export/import twice SHALL produce the same result.
         """
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f1:
-            path1 = Path(f1.name)
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f2:
-            path2 = Path(f2.name)
+        path1 = _mkpath(".json")
+        path2 = _mkpath(".json")
 
         try:
             # First roundtrip
@@ -20,6 +20,10 @@ from hypothesis import strategies as st
 from farmer_cli.models.history import DownloadHistory
 
 
+# Fixed timestamp used where a test only needs *a* datetime value
+_FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+
 # ---------------------------------------------------------------------------
 # Strategies for generating test data
 # ---------------------------------------------------------------------------
@@ -27,6 +31,9 @@ from farmer_cli.models.history import DownloadHistory
 # Strategy for generating valid UUIDs
 uuid_strategy = st.uuids().map(str)
 
+# Cheap non-empty ID strategy for tests that only check presence of the id
+cheap_id_strategy = st.integers(min_value=0, max_value=2**31 - 1).map(lambda i: f"id-{i:08x}")
+
 # Strategy for generating valid URLs
 url_strategy = st.text(
     alphabet=string.ascii_letters + string.digits + "/:.-_?=&%",
@@ -97,6 +104,29 @@ download_history_strategy = st.builds(
     status=status_strategy,
 )
 
+# Lean strategy for tests that only inspect id/url/title/file_path: the
+# optional metadata and status are pinned so no entropy is spent on them
+download_history_strategy_fast = st.builds(
+    DownloadHistory,
+    id=cheap_id_strategy,
+    url=url_strategy,
+    title=title_strategy,
+    file_path=file_path_strategy,
+    file_size=st.just(None),
+    format_id=st.just(None),
+    duration=st.just(None),
+    uploader=st.just(None),
+    status=st.just("completed"),
+)
+
+# Required fields shared by tests that only vary a single field; each example
+# builds its own DownloadHistory from these so no state leaks between draws
+_TEMPLATE_FIELDS = {
+    "url": "https://example.com/x",
+    "title": "x",
+    "file_path": "/downloads/x.mp4",
+}
+
 
 # ---------------------------------------------------------------------------
 # Property Tests
@@ -113,7 +143,7 @@ class TestHistoryEntryCompleteness:
     **Validates: Requirements 5.2**
     """
 
-    @given(download_history_strategy)
+    @given(download_history_strategy_fast)
     @settings(max_examples=100)
     @pytest.mark.property
     def test_id_is_never_null(self, history: DownloadHistory):
@@ -124,9 +154,9 @@ class TestHistoryEntryCompleteness:
         For any DownloadHistory, id SHALL be non-null and non-empty.
         """
         assert history.id is not None, "id should not be None"
-        assert len(history.id) > 0, "id should not be empty"
+        assert history.id, "id should not be empty"
 
-    @given(download_history_strategy)
+    @given(download_history_strategy_fast)
     @settings(max_examples=100)
     @pytest.mark.property
     def test_url_is_never_null(self, history: DownloadHistory):
@@ -137,9 +167,9 @@ class TestHistoryEntryCompleteness:
         For any DownloadHistory, url SHALL be non-null and non-empty.
         """
         assert history.url is not None, "url should not be None"
-        assert len(history.url) > 0, "url should not be empty"
+        assert history.url, "url should not be empty"
 
-    @given(download_history_strategy)
+    @given(download_history_strategy_fast)
     @settings(max_examples=100)
     @pytest.mark.property
     def test_title_is_never_null(self, history: DownloadHistory):
@@ -150,9 +180,9 @@ class TestHistoryEntryCompleteness:
         For any DownloadHistory, title SHALL be non-null and non-empty.
         """
         assert history.title is not None, "title should not be None"
-        assert len(history.title) > 0, "title should not be empty"
+        assert history.title, "title should not be empty"
 
-    @given(download_history_strategy)
+    @given(download_history_strategy_fast)
     @settings(max_examples=100)
     @pytest.mark.property
     def test_file_path_is_never_null(self, history: DownloadHistory):
@@ -163,7 +193,7 @@ class TestHistoryEntryCompleteness:
         For any DownloadHistory, file_path SHALL be non-null and non-empty.
         """
         assert history.file_path is not None, "file_path should not be None"
-        assert len(history.file_path) > 0, "file_path should not be empty"
+        assert history.file_path, "file_path should not be empty"
 
     @given(download_history_strategy)
     @settings(max_examples=100)
@@ -179,7 +209,7 @@ class TestHistoryEntryCompleteness:
         # The model has a default for downloaded_at, so it should be set
         # Note: In actual DB usage, this would be set by the default
         # For this test, we verify the model accepts datetime values
-        history.downloaded_at = datetime.utcnow()
+        history.downloaded_at = _FIXED_TS
         assert history.downloaded_at is not None, "downloaded_at should not be None"
         assert isinstance(history.downloaded_at, datetime), "downloaded_at should be a datetime"
 
@@ -194,7 +224,7 @@ class TestHistoryEntryCompleteness:
         For any DownloadHistory, to_dict() SHALL contain all required fields.
         """
         # Set downloaded_at for the test
-        history.downloaded_at = datetime.utcnow()
+        history.downloaded_at = _FIXED_TS
 
         result = history.to_dict()
 
@@ -257,32 +287,36 @@ class TestHistoryEntryCompleteness:
         with pytest.raises(ValueError, match="File path cannot be empty"):
             DownloadHistory(url=url, title=title, file_path=file_path)
 
-    @given(download_history_strategy)
+    @given(file_size_strategy)
     @settings(max_examples=100)
     @pytest.mark.property
-    def test_file_size_formatted_is_never_empty(self, history: DownloadHistory):
+    def test_file_size_formatted_is_never_empty(self, file_size: int | None):
         """
         Feature: farmer-cli-completion, Property 7: History Entry Completeness
         Validates: Requirements 5.2
 
         For any DownloadHistory, file_size_formatted SHALL produce a non-empty string.
         """
+        history = DownloadHistory(**_TEMPLATE_FIELDS, file_size=file_size)
+
         formatted = history.file_size_formatted
 
         assert formatted is not None, "file_size_formatted should not be None"
-        assert len(formatted) > 0, "file_size_formatted should not be empty"
+        assert formatted, "file_size_formatted should not be empty"
 
-    @given(download_history_strategy)
+    @given(duration_strategy)
     @settings(max_examples=100)
     @pytest.mark.property
-    def test_duration_formatted_is_never_empty(self, history: DownloadHistory):
+    def test_duration_formatted_is_never_empty(self, duration: int | None):
         """
         Feature: farmer-cli-completion, Property 7: History Entry Completeness
         Validates: Requirements 5.2
 
         For any DownloadHistory, duration_formatted SHALL produce a non-empty string.
         """
+        history = DownloadHistory(**_TEMPLATE_FIELDS, duration=duration)
+
         formatted = history.duration_formatted
 
         assert formatted is not None, "duration_formatted should not be None"
-        assert len(formatted) > 0, "duration_formatted should not be empty"
+        assert formatted, "duration_formatted should not be empty"
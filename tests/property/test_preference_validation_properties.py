@@ -10,7 +10,7 @@ values of the expected type and reject invalid types or out-of-range values.
 """
 
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from farmer_cli.services.preferences import (
@@ -20,6 +20,11 @@ from farmer_cli.services.preferences import (
 )
 
 
+# Error message fragments produced by PreferenceSchema.validate
+_EXPECTED_TYPE_MSG = "Expected type"
+_NOT_IN_ALLOWED_MSG = "not in allowed values"
+
+
 # ---------------------------------------------------------------------------
 # Strategies for generating test data
 # ---------------------------------------------------------------------------
@@ -33,24 +38,69 @@ valid_bool_strategy = st.booleans()
 # Strategy for valid integer values (general)
 valid_int_strategy = st.integers(min_value=-1000, max_value=1000)
 
-# Strategy for invalid types (wrong type for any preference)
-invalid_type_for_string = st.one_of(
-    st.integers(),
-    st.lists(st.integers(), max_size=3),
-    st.dictionaries(st.text(max_size=5), st.integers(), max_size=3),
-)
+# Strategy for keys that can never collide with a schema key
+unknown_key_strategy = st.text(min_size=1, max_size=50).map(lambda s: "zz__unknown__" + s)
 
-invalid_type_for_bool = st.one_of(
-    st.text(min_size=1, max_size=10),
-    st.integers(),
-    st.lists(st.integers(), max_size=3),
-)
+# Canonical wrong-type values: validation branches on type, not value, so one
+# exemplar per type covers each rejection path
+INVALID_FOR_STRING = (42, 3.14, True, [1, 2], {"k": 1})
+INVALID_FOR_BOOL = ("hello", 42, 3.14, [1, 2], {"k": 1})
+INVALID_FOR_INT = ("hello", True, 3.14, [1, 2], {"k": 1})
 
-invalid_type_for_int = st.one_of(
-    st.text(min_size=1, max_size=10),
-    st.booleans(),
-    st.lists(st.integers(), max_size=3),
-)
+# Strategy for invalid types (wrong type for any preference)
+invalid_type_for_string = st.sampled_from(INVALID_FOR_STRING)
+
+invalid_type_for_bool = st.sampled_from(INVALID_FOR_BOOL)
+
+invalid_type_for_int = st.sampled_from(INVALID_FOR_INT)
+
+# Strategy for one wrong-typed value per typed preference, validated in a
+# single validate_all() call
+invalid_type_bundle_strategy = st.fixed_dictionaries({
+    "theme": invalid_type_for_string,
+    "first_run": invalid_type_for_bool,
+    "check_updates": invalid_type_for_bool,
+    "show_tips": invalid_type_for_bool,
+    "prefer_audio_only": invalid_type_for_bool,
+    "max_concurrent_downloads": invalid_type_for_int,
+})
+
+
+# Schema registry materialized once for per-key parametrization
+_SCHEMA_ITEMS = list(PREFERENCE_SCHEMAS.items())
+_SCHEMA_IDS = [key for key, _ in _SCHEMA_ITEMS]
+
+# Known-bad value for each schema base type
+_WRONG_TYPE_VALUES = {str: 123, bool: "yes", int: "3"}
+
+
+def _wrong_type_value(schema: PreferenceSchema):
+    """Return a value whose type the given schema rejects."""
+    expected = schema.expected_type
+    base = expected if isinstance(expected, type) else expected[0]
+    return _WRONG_TYPE_VALUES[base]
+
+
+# Out-of-range and disallowed values for every constrained schema, plus the
+# mixed wrong-type/out-of-range case; each entry is (id, prefs, rejected keys)
+_VALIDATE_ALL_INVALID_CASES = [
+    *(
+        (f"{key}-below-min", {key: schema.min_value - 1}, {key})
+        for key, schema in _SCHEMA_ITEMS
+        if schema.min_value is not None
+    ),
+    *(
+        (f"{key}-above-max", {key: schema.max_value + 1}, {key})
+        for key, schema in _SCHEMA_ITEMS
+        if schema.max_value is not None
+    ),
+    *(
+        (f"{key}-not-allowed", {key: "zz__not_allowed__"}, {key})
+        for key, schema in _SCHEMA_ITEMS
+        if schema.allowed_values is not None
+    ),
+    ("mixed", {"theme": 123, "max_concurrent_downloads": 100}, {"theme", "max_concurrent_downloads"}),
+]
 
 
 # ---------------------------------------------------------------------------
@@ -167,7 +217,7 @@ class TestPreferenceValueValidation:
 
         is_valid, error_msg = service.validate_preference("export_format", value)
         assert not is_valid, f"Disallowed value '{value}' was accepted"
-        assert "not in allowed values" in error_msg
+        assert _NOT_IN_ALLOWED_MSG in error_msg
 
     @given(st.sampled_from(["rename", "overwrite", "skip"]))
     @settings(max_examples=100)
@@ -201,115 +251,109 @@ class TestPreferenceValueValidation:
         )
         assert is_valid, f"Allowed value '{value}' rejected: {error_msg}"
 
-    @given(invalid_type_for_bool)
+    @given(invalid_type_bundle_strategy)
     @settings(max_examples=100)
     @pytest.mark.property
-    def test_boolean_preferences_reject_wrong_types(self, value):
+    def test_typed_preferences_reject_wrong_types(self, prefs: dict):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        For any non-boolean value, boolean-type preferences SHALL reject it.
+        For any wrong-typed values across string, boolean and integer
+        preferences, validate_all() SHALL reject every key with a type error.
         """
         service = PreferencesService()
 
-        for key in ["first_run", "check_updates", "show_tips", "prefer_audio_only"]:
-            is_valid, error_msg = service.validate_preference(key, value)
-            assert not is_valid, f"Wrong type {type(value)} accepted for {key}"
-            assert "Expected type" in error_msg
+        all_valid, errors = service.validate_all(prefs)
+        assert not all_valid, f"Wrong types accepted: {prefs}"
+        assert set(errors) == set(prefs), f"Not all wrong types rejected: {errors}"
+        for key, error_msg in errors.items():
+            assert _EXPECTED_TYPE_MSG in error_msg, f"Unexpected error for {key}: {error_msg}"
 
-    @given(invalid_type_for_int)
+    @given(unknown_key_strategy)
     @settings(max_examples=100)
     @pytest.mark.property
-    def test_integer_preferences_reject_wrong_types(self, value):
+    def test_unknown_keys_are_accepted(self, key: str):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        For any non-integer value, integer-type preferences SHALL reject it.
+        For any unknown preference key, validation SHALL accept any value
+        (to allow extensibility).
         """
         service = PreferencesService()
 
-        is_valid, error_msg = service.validate_preference(
-            "max_concurrent_downloads", value
-        )
-        assert not is_valid, f"Wrong type {type(value)} accepted"
-        assert "Expected type" in error_msg
+        # Unknown keys should be accepted with any value
+        is_valid, error_msg = service.validate_preference(key, "any_value")
+        assert is_valid, f"Unknown key '{key}' was rejected"
 
-    @given(invalid_type_for_string)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("key,schema", _SCHEMA_ITEMS, ids=_SCHEMA_IDS)
     @pytest.mark.property
-    def test_string_preferences_reject_wrong_types(self, value):
+    def test_all_schemas_have_valid_defaults(self, key: str, schema: PreferenceSchema):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        For any non-string value, string-type preferences SHALL reject it.
+        For all defined preference schemas, the default value SHALL pass validation.
         """
         service = PreferencesService()
 
-        is_valid, error_msg = service.validate_preference("theme", value)
-        assert not is_valid, f"Wrong type {type(value)} accepted for theme"
-        assert "Expected type" in error_msg
+        is_valid, error_msg = service.validate_preference(key, schema.default)
+        assert is_valid, (
+            f"Default value {schema.default} for '{key}' failed validation: "
+            f"{error_msg}"
+        )
 
-    @given(st.text(min_size=1, max_size=50))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("key,schema", _SCHEMA_ITEMS, ids=_SCHEMA_IDS)
     @pytest.mark.property
-    def test_unknown_keys_are_accepted(self, key: str):
+    def test_validate_all_accepts_schema_default(self, key: str, schema: PreferenceSchema):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        For any unknown preference key, validation SHALL accept any value
-        (to allow extensibility).
+        validate_all() SHALL return (True, {}) for each key's default value.
         """
-        assume(key not in PREFERENCE_SCHEMAS)
-
         service = PreferencesService()
 
-        # Unknown keys should be accepted with any value
-        is_valid, error_msg = service.validate_preference(key, "any_value")
-        assert is_valid, f"Unknown key '{key}' was rejected"
+        all_valid, errors = service.validate_all({key: schema.default})
+        assert all_valid is True, f"Default for '{key}' rejected: {errors}"
+        assert errors == {}
 
+    @pytest.mark.parametrize(
+        "prefs,rejected",
+        [case[1:] for case in _VALIDATE_ALL_INVALID_CASES],
+        ids=[case[0] for case in _VALIDATE_ALL_INVALID_CASES],
+    )
     @pytest.mark.property
-    def test_all_schemas_have_valid_defaults(self):
+    def test_validate_all_rejects_invalid_values(self, prefs: dict, rejected: set):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        For all defined preference schemas, the default value SHALL pass validation.
+        validate_all() SHALL return (False, errors) with exactly the keys whose
+        values are out of range, not allowed, or of the wrong type.
         """
         service = PreferencesService()
 
-        for key, schema in PREFERENCE_SCHEMAS.items():
-            is_valid, error_msg = service.validate_preference(key, schema.default)
-            assert is_valid, (
-                f"Default value {schema.default} for '{key}' failed validation: "
-                f"{error_msg}"
-            )
+        all_valid, errors = service.validate_all(prefs)
+        assert isinstance(all_valid, bool)
+        assert isinstance(errors, dict)
+        assert all_valid is False, f"Invalid preferences accepted: {prefs}"
+        assert set(errors) == rejected
 
+    @pytest.mark.parametrize("key,schema", _SCHEMA_ITEMS, ids=_SCHEMA_IDS)
     @pytest.mark.property
-    def test_validate_all_returns_correct_structure(self):
+    def test_validate_all_rejects_wrong_type(self, key: str, schema: PreferenceSchema):
         """
         Feature: farmer-cli-completion, Property 17: Preference Value Validation
         Validates: Requirements 8.4
 
-        validate_all() SHALL return a tuple of (bool, dict) with correct structure.
+        validate_all() SHALL return (False, {key: message}) for a value of
+        the wrong type.
         """
         service = PreferencesService()
 
-        # Valid preferences
-        valid_prefs = {"theme": "dark", "first_run": False}
-        all_valid, errors = service.validate_all(valid_prefs)
-        assert isinstance(all_valid, bool)
-        assert isinstance(errors, dict)
-        assert all_valid is True
-        assert len(errors) == 0
-
-        # Invalid preferences
-        invalid_prefs = {"theme": 123, "max_concurrent_downloads": 100}
-        all_valid, errors = service.validate_all(invalid_prefs)
-        assert all_valid is False
-        assert len(errors) == 2
-        assert "theme" in errors
-        assert "max_concurrent_downloads" in errors
+        all_valid, errors = service.validate_all({key: _wrong_type_value(schema)})
+        assert all_valid is False, f"Wrong type accepted for '{key}'"
+        assert set(errors) == {key}
+        assert errors[key]
@@ -13,29 +13,37 @@ import json
 import string
 
 import pytest
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
 from farmer_cli.models.user import User
 
+from ._strategies import VALID_NAME as valid_name_strategy
+
+
+# orjson is an optional speed-up; fall back to the stdlib when it is missing
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 # ---------------------------------------------------------------------------
 # Strategies for generating test data
 # ---------------------------------------------------------------------------
 
-# Strategy for generating valid user names
-valid_name_strategy = st.text(
-    alphabet=string.ascii_letters + string.digits + " -_.",
-    min_size=1,
-    max_size=100,
-).filter(lambda x: x.strip())
-
 # Strategy for generating valid preference values
 preference_value_strategy = st.one_of(
     st.text(min_size=0, max_size=50),
     st.integers(min_value=-1000, max_value=1000),
     st.booleans(),
-    st.floats(allow_nan=False, allow_infinity=False),
+    st.floats(allow_nan=False, allow_infinity=False, min_value=-1e9, max_value=1e9, width=32),
     st.none(),
 )
 
@@ -54,6 +62,13 @@ preferences_strategy = st.dictionaries(
     max_size=10,
 )
 
+# Strategy for generating (key, value) preference pairs
+preference_items_strategy = st.lists(
+    st.tuples(preference_key_strategy, preference_value_strategy),
+    min_size=1,
+    max_size=5,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helper Functions
@@ -88,7 +103,7 @@ def deserialize_user(data: dict) -> User:
     """
     return User(
         name=data["name"],
-        preferences=json.dumps(data["preferences"]),
+        preferences=_dumps(data["preferences"]),
     )
 
 
@@ -108,104 +123,33 @@ class TestUserSerializationRoundTrip:
     """
 
     @given(valid_name_strategy, preferences_strategy)
-    @settings(max_examples=100)
     @pytest.mark.property
-    def test_user_roundtrip_preserves_name(self, name: str, preferences: dict):
+    def test_user_full_roundtrip(self, name: str, preferences: dict):
         """
         Feature: farmer-cli-completion, Property 1: User Serialization Round-Trip
         Validates: Requirements 7.6
 
-        For any valid User, serializing then deserializing SHALL preserve
-        the user's name.
+        For any valid User, converting to a JSON string and back SHALL
+        preserve the name and preferences, and a second roundtrip SHALL
+        produce the same result as the first.
         """
         # Create original user
-        original = User(name=name, preferences=json.dumps(preferences))
+        original = User(name=name, preferences=_dumps(preferences))
 
-        # Serialize to dict
-        serialized = serialize_user(original)
+        # First roundtrip through a JSON string
+        json_str = _dumps(serialize_user(original))
+        restored = deserialize_user(_loads(json_str))
 
-        # Deserialize back to User
-        restored = deserialize_user(serialized)
-
-        # Name should be identical
+        # Name and preferences should be identical
         assert restored.name == original.name
-
-    @given(valid_name_strategy, preferences_strategy)
-    @settings(max_examples=100)
-    @pytest.mark.property
-    def test_user_roundtrip_preserves_preferences(self, name: str, preferences: dict):
-        """
-        Feature: farmer-cli-completion, Property 1: User Serialization Round-Trip
-        Validates: Requirements 7.6
-
-        For any valid User, serializing then deserializing SHALL preserve
-        the user's preferences.
-        """
-        # Create original user
-        original = User(name=name, preferences=json.dumps(preferences))
-
-        # Serialize to dict
-        serialized = serialize_user(original)
-
-        # Deserialize back to User
-        restored = deserialize_user(serialized)
-
-        # Preferences should be equivalent
         assert restored.preferences_dict == original.preferences_dict
 
-    @given(valid_name_strategy, preferences_strategy)
-    @settings(max_examples=100)
-    @pytest.mark.property
-    def test_user_json_roundtrip(self, name: str, preferences: dict):
-        """
-        Feature: farmer-cli-completion, Property 1: User Serialization Round-Trip
-        Validates: Requirements 7.6
-
-        For any valid User, converting to JSON string and back SHALL
-        produce an equivalent User.
-        """
-        # Create original user
-        original = User(name=name, preferences=json.dumps(preferences))
-
-        # Serialize to JSON string
-        json_str = json.dumps(serialize_user(original))
-
-        # Deserialize from JSON string
-        data = json.loads(json_str)
-        restored = deserialize_user(data)
-
-        # Should be equivalent
-        assert restored.name == original.name
-        assert restored.preferences_dict == original.preferences_dict
-
-    @given(valid_name_strategy, preferences_strategy)
-    @settings(max_examples=100)
-    @pytest.mark.property
-    def test_double_roundtrip_is_idempotent(self, name: str, preferences: dict):
-        """
-        Feature: farmer-cli-completion, Property 1: User Serialization Round-Trip
-        Validates: Requirements 7.6
-
-        For any valid User, performing the roundtrip twice SHALL produce
-        the same result as performing it once.
-        """
-        # Create original user
-        original = User(name=name, preferences=json.dumps(preferences))
-
-        # First roundtrip
-        serialized1 = serialize_user(original)
-        restored1 = deserialize_user(serialized1)
-
-        # Second roundtrip
-        serialized2 = serialize_user(restored1)
-        restored2 = deserialize_user(serialized2)
-
-        # Both restored users should be equivalent
-        assert restored1.name == restored2.name
-        assert restored1.preferences_dict == restored2.preferences_dict
+        # Second roundtrip should reproduce the first
+        restored_again = deserialize_user(serialize_user(restored))
+        assert restored_again.name == restored.name
+        assert restored_again.preferences_dict == restored.preferences_dict
 
     @given(valid_name_strategy)
-    @settings(max_examples=100)
     @pytest.mark.property
     def test_empty_preferences_roundtrip(self, name: str):
         """
@@ -226,12 +170,7 @@ class TestUserSerializationRoundTrip:
         assert restored.preferences_dict == {}
         assert restored.name == original.name
 
-    @given(valid_name_strategy, st.lists(
-        st.tuples(preference_key_strategy, preference_value_strategy),
-        min_size=1,
-        max_size=5,
-    ))
-    @settings(max_examples=100)
+    @given(valid_name_strategy, preference_items_strategy)
     @pytest.mark.property
     def test_preferences_dict_setter_roundtrip(self, name: str, pref_items: list):
         """
@@ -255,7 +194,6 @@ class TestUserSerializationRoundTrip:
         assert retrieved == prefs
 
     @given(valid_name_strategy, preference_key_strategy, preference_value_strategy)
-    @settings(max_examples=100)
     @pytest.mark.property
     def test_single_preference_roundtrip(self, name: str, key: str, value):
         """
@@ -278,7 +216,6 @@ class TestUserSerializationRoundTrip:
         assert retrieved == value
 
     @given(valid_name_strategy, preferences_strategy)
-    @settings(max_examples=100)
     @pytest.mark.property
     def test_serialization_produces_valid_json(self, name: str, preferences: dict):
         """
@@ -288,18 +225,18 @@ class TestUserSerializationRoundTrip:
         For any valid User, serialization SHALL produce valid JSON.
         """
         # Create user
-        user = User(name=name, preferences=json.dumps(preferences))
+        user = User(name=name, preferences=_dumps(preferences))
 
         # Serialize
         serialized = serialize_user(user)
 
         # Should be JSON-serializable without error
-        json_str = json.dumps(serialized)
+        json_str = _dumps(serialized)
         assert isinstance(json_str, str)
         assert len(json_str) > 0
 
         # Should be parseable back
-        parsed = json.loads(json_str)
+        parsed = _loads(json_str)
         assert isinstance(parsed, dict)
         assert "name" in parsed
         assert "preferences" in parsed
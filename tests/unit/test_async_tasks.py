@@ -1,8 +1,38 @@
 """Unit tests for async_tasks.py module."""
 
-import pytest
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.farmer_cli.services.async_tasks import AsyncTaskManager
+from src.farmer_cli.services.async_tasks import example_async_task
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """Provide one event loop shared by the module's async tests."""
+    # Tests drive the loop directly, so it is never installed as the current loop
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+class _StubTask:
+    """Minimal stand-in for asyncio.Task that records cancel() calls."""
+
+    __slots__ = ("_done", "cancel_calls")
+
+    def __init__(self, done):
+        self._done = done
+        self.cancel_calls = 0
+
+    def done(self):
+        return self._done
+
+    def cancel(self):
+        self.cancel_calls += 1
 
 
 class TestAsyncTaskManager:
@@ -10,16 +40,12 @@ class TestAsyncTaskManager:
 
     def test_init(self):
         """Test AsyncTaskManager initialization."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
 
         assert manager.running_tasks == {}
 
     def test_cancel_task_not_found(self):
         """Test cancel_task returns False for non-existent task."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
 
         result = manager.cancel_task("nonexistent")
@@ -28,103 +54,85 @@ class TestAsyncTaskManager:
 
     def test_cancel_task_success(self):
         """Test cancel_task cancels running task."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
-        mock_task = MagicMock()
-        mock_task.done.return_value = False
-        manager.running_tasks["test_task"] = mock_task
+        stub = _StubTask(done=False)
+        manager.running_tasks["test_task"] = stub
 
         result = manager.cancel_task("test_task")
 
         assert result is True
-        mock_task.cancel.assert_called_once()
+        assert stub.cancel_calls == 1
 
     def test_cancel_task_already_done(self):
         """Test cancel_task returns False for completed task."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
-        mock_task = MagicMock()
-        mock_task.done.return_value = True
-        manager.running_tasks["test_task"] = mock_task
+        stub = _StubTask(done=True)
+        manager.running_tasks["test_task"] = stub
 
         result = manager.cancel_task("test_task")
 
         assert result is False
+        assert stub.cancel_calls == 0
 
     def test_cancel_all_tasks(self):
         """Test cancel_all_tasks cancels all running tasks."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
 
-        mock_task1 = MagicMock()
-        mock_task1.done.return_value = False
-        mock_task2 = MagicMock()
-        mock_task2.done.return_value = False
-        mock_task3 = MagicMock()
-        mock_task3.done.return_value = True  # Already done
+        task1 = _StubTask(done=False)
+        task2 = _StubTask(done=False)
+        task3 = _StubTask(done=True)  # Already done
 
         manager.running_tasks = {
-            "task1": mock_task1,
-            "task2": mock_task2,
-            "task3": mock_task3,
+            "task1": task1,
+            "task2": task2,
+            "task3": task3,
         }
 
         cancelled = manager.cancel_all_tasks()
 
         assert cancelled == 2
-        mock_task1.cancel.assert_called_once()
-        mock_task2.cancel.assert_called_once()
-        mock_task3.cancel.assert_not_called()
+        assert task1.cancel_calls == 1
+        assert task2.cancel_calls == 1
+        assert task3.cancel_calls == 0
         assert manager.running_tasks == {}
 
-    def test_run_with_progress_with_live_sync(self):
-        """Test run_with_progress with live display using event loop."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
+    def test_cancel_all_tasks_cancels_many(self, loop):
+        """Test cancel_all_tasks cancels every pending task and empties the registry."""
+        manager = AsyncTaskManager()
+        futures = [loop.create_future() for _ in range(3000)]
+        manager.running_tasks = {f"task{i}": future for i, future in enumerate(futures)}
+
+        cancelled = manager.cancel_all_tasks()
+
+        assert cancelled == 3000
+        assert all(future.cancelled() for future in futures)
+        assert manager.running_tasks == {}
 
+    def test_run_with_progress_with_live_sync(self, loop):
+        """Test run_with_progress with live display using event loop."""
         manager = AsyncTaskManager()
         mock_live = MagicMock()
+        sample_task = AsyncMock(return_value="result")
 
-        async def sample_task():
-            return "result"
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(
-                manager.run_with_progress(sample_task, "Test Task", live=mock_live)
-            )
-        finally:
-            loop.close()
+        result = loop.run_until_complete(
+            manager.run_with_progress(sample_task, "Test Task", live=mock_live)
+        )
 
         assert result == "result"
 
-    def test_run_with_progress_handles_error_sync(self):
+    def test_run_with_progress_handles_error_sync(self, loop):
         """Test run_with_progress handles errors using event loop."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
         mock_live = MagicMock()
+        failing_task = AsyncMock(side_effect=ValueError("test error"))
 
-        async def failing_task():
-            raise ValueError("test error")
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            with pytest.raises(ValueError, match="test error"):
-                loop.run_until_complete(
-                    manager.run_with_progress(failing_task, "Test Task", live=mock_live)
-                )
-        finally:
-            loop.close()
+        with pytest.raises(ValueError, match="test error"):
+            loop.run_until_complete(
+                manager.run_with_progress(failing_task, "Test Task", live=mock_live)
+            )
 
-    def test_gather_with_timeout_sync(self):
+    def test_gather_with_timeout_sync(self, loop):
         """Test gather_with_timeout using event loop."""
-        from src.farmer_cli.services.async_tasks import AsyncTaskManager
-
         manager = AsyncTaskManager()
 
         async def run_gather():
@@ -139,12 +147,7 @@ class TestAsyncTaskManager:
                 asyncio.create_task(task2())
             )
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            results = loop.run_until_complete(run_gather())
-        finally:
-            loop.close()
+        results = loop.run_until_complete(run_gather())
 
         assert results == [1, 2]
 
@@ -152,16 +155,9 @@ class TestAsyncTaskManager:
 class TestExampleAsyncTask:
     """Tests for example_async_task function."""
 
-    def test_example_async_task_sync(self):
+    def test_example_async_task_sync(self, loop):
         """Test example_async_task completes using event loop."""
-        from src.farmer_cli.services.async_tasks import example_async_task
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(example_async_task(duration=0))
-        finally:
-            loop.close()
+        result = loop.run_until_complete(example_async_task(duration=0))
 
         assert "completed" in result.lower()
         assert "0" in result
@@ -1,18 +1,23 @@
 """Tests for cleanup.py module."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.farmer_cli.utils import cleanup
+from src.farmer_cli.utils.cleanup import _cleanup_handlers
+from src.farmer_cli.utils.cleanup import _run_cleanup_handler
+from src.farmer_cli.utils.cleanup import cleanup_handler
+from src.farmer_cli.utils.cleanup import register_cleanup
+
 
 class TestRegisterCleanup:
     """Tests for register_cleanup function."""
 
     def test_register_cleanup(self):
         """Test registering a cleanup handler."""
-        from src.farmer_cli.utils.cleanup import _cleanup_handlers, register_cleanup
-
         initial_count = len(_cleanup_handlers)
         handler = MagicMock()
 
@@ -30,8 +35,6 @@ class TestRunCleanupHandler:
 
     def test_run_cleanup_handler_success(self):
         """Test running a successful cleanup handler."""
-        from src.farmer_cli.utils.cleanup import _run_cleanup_handler
-
         handler = MagicMock()
         _run_cleanup_handler(handler)
 
@@ -40,8 +43,6 @@ class TestRunCleanupHandler:
     @patch("src.farmer_cli.utils.cleanup.logger")
     def test_run_cleanup_handler_error(self, mock_logger):
         """Test running a cleanup handler that raises an error."""
-        from src.farmer_cli.utils.cleanup import _run_cleanup_handler
-
         handler = MagicMock(side_effect=Exception("Test error"))
         _run_cleanup_handler(handler)
 
@@ -49,92 +50,68 @@ class TestRunCleanupHandler:
         mock_logger.error.assert_called_once()
 
 
+@pytest.fixture
+def cleanup_patches(monkeypatch):
+    """Replace cleanup_handler's collaborators with mocks and expose them by name."""
+    prefs = MagicMock()
+    prefs.load.return_value = {}
+    db = MagicMock()
+    mocks = SimpleNamespace(
+        console=MagicMock(),
+        logger=MagicMock(),
+        prefs=prefs,
+        prefs_class=MagicMock(return_value=prefs),
+        db=db,
+        get_db=MagicMock(return_value=db),
+        handlers=[],
+    )
+    monkeypatch.setattr(cleanup, "console", mocks.console)
+    monkeypatch.setattr(cleanup, "logger", mocks.logger)
+    monkeypatch.setattr(cleanup, "PreferencesService", mocks.prefs_class)
+    monkeypatch.setattr(cleanup, "get_database_manager", mocks.get_db)
+    monkeypatch.setattr(cleanup, "_cleanup_handlers", mocks.handlers)
+    return mocks
+
+
 class TestCleanupHandler:
     """Tests for cleanup_handler function."""
 
-    @patch("src.farmer_cli.utils.cleanup.console")
-    @patch("src.farmer_cli.utils.cleanup.PreferencesService")
-    @patch("src.farmer_cli.utils.cleanup.get_database_manager")
-    @patch("src.farmer_cli.utils.cleanup._cleanup_handlers", [])
-    def test_cleanup_handler_success(self, mock_db, mock_prefs_class, mock_console):
+    def test_cleanup_handler_success(self, cleanup_patches):
         """Test successful cleanup."""
-        from src.farmer_cli.utils.cleanup import cleanup_handler
-
-        mock_prefs = MagicMock()
-        mock_prefs.load.return_value = {}
-        mock_prefs_class.return_value = mock_prefs
-
-        mock_db_manager = MagicMock()
-        mock_db.return_value = mock_db_manager
-
         cleanup_handler()
 
-        mock_console.print.assert_called()
-        mock_prefs.save.assert_called_once()
-        mock_db_manager.close.assert_called_once()
+        cleanup_patches.console.print.assert_called()
+        cleanup_patches.prefs.save.assert_called_once()
+        cleanup_patches.db.close.assert_called_once()
 
-    @patch("src.farmer_cli.utils.cleanup.console")
-    @patch("src.farmer_cli.utils.cleanup.PreferencesService")
-    @patch("src.farmer_cli.utils.cleanup.get_database_manager")
-    @patch("src.farmer_cli.utils.cleanup.logger")
-    @patch("src.farmer_cli.utils.cleanup._cleanup_handlers", [])
-    def test_cleanup_handler_prefs_error(self, mock_logger, mock_db, mock_prefs_class, mock_console):
+    def test_cleanup_handler_prefs_error(self, cleanup_patches):
         """Test cleanup with preferences error."""
-        from src.farmer_cli.utils.cleanup import cleanup_handler
-
-        mock_prefs_class.side_effect = Exception("Prefs error")
-        mock_db_manager = MagicMock()
-        mock_db.return_value = mock_db_manager
+        cleanup_patches.prefs_class.side_effect = Exception("Prefs error")
 
         cleanup_handler()
 
-        mock_logger.error.assert_called()
+        cleanup_patches.logger.error.assert_called()
 
-    @patch("src.farmer_cli.utils.cleanup.console")
-    @patch("src.farmer_cli.utils.cleanup.PreferencesService")
-    @patch("src.farmer_cli.utils.cleanup.get_database_manager")
-    @patch("src.farmer_cli.utils.cleanup.logger")
-    @patch("src.farmer_cli.utils.cleanup._cleanup_handlers", [])
-    def test_cleanup_handler_db_error(self, mock_logger, mock_db, mock_prefs_class, mock_console):
+    def test_cleanup_handler_db_error(self, cleanup_patches):
         """Test cleanup with database error."""
-        from src.farmer_cli.utils.cleanup import cleanup_handler
-
-        mock_prefs = MagicMock()
-        mock_prefs.load.return_value = {}
-        mock_prefs_class.return_value = mock_prefs
-
-        mock_db.side_effect = Exception("DB error")
+        cleanup_patches.get_db.side_effect = Exception("DB error")
 
         cleanup_handler()
 
-        mock_logger.error.assert_called()
+        cleanup_patches.logger.error.assert_called()
 
-    @patch("src.farmer_cli.utils.cleanup.console")
-    @patch("src.farmer_cli.utils.cleanup.PreferencesService")
-    @patch("src.farmer_cli.utils.cleanup.get_database_manager")
-    @patch("src.farmer_cli.utils.cleanup._run_cleanup_handler")
-    def test_cleanup_handler_runs_registered_handlers(
-        self, mock_run_handler, mock_db, mock_prefs_class, mock_console
-    ):
+    def test_cleanup_handler_runs_registered_handlers(self, cleanup_patches, monkeypatch):
         """Test that registered handlers are called."""
-        from src.farmer_cli.utils.cleanup import _cleanup_handlers, cleanup_handler
-
-        mock_prefs = MagicMock()
-        mock_prefs.load.return_value = {}
-        mock_prefs_class.return_value = mock_prefs
-
-        mock_db_manager = MagicMock()
-        mock_db.return_value = mock_db_manager
+        mock_run_handler = MagicMock()
+        monkeypatch.setattr(cleanup, "_run_cleanup_handler", mock_run_handler)
 
         # Add a test handler
         test_handler = MagicMock()
-        _cleanup_handlers.append(test_handler)
+        cleanup_patches.handlers.append(test_handler)
 
-        try:
-            cleanup_handler()
-            mock_run_handler.assert_called()
-        finally:
-            _cleanup_handlers.remove(test_handler)
+        cleanup_handler()
+
+        mock_run_handler.assert_called_once_with(test_handler)
 
 
 class TestCleanupTempFiles:
@@ -143,8 +120,6 @@ class TestCleanupTempFiles:
     @patch("src.farmer_cli.utils.cleanup.logger")
     def test_cleanup_temp_files_no_files(self, mock_logger, tmp_path, monkeypatch):
         """Test cleanup when no temp files exist."""
-        from src.farmer_cli.utils import cleanup
-
         # Patch the constant to a non-existent file
         monkeypatch.setattr("src.farmer_cli.core.constants.HTML_TEMP_FILE", str(tmp_path / "nonexistent.html"))
 
@@ -156,8 +131,6 @@ class TestCleanupTempFiles:
     @patch("src.farmer_cli.utils.cleanup.logger")
     def test_cleanup_temp_files_with_files(self, mock_logger, tmp_path, monkeypatch):
         """Test cleanup when temp files exist."""
-        from src.farmer_cli.utils import cleanup
-
         # Create actual temp files
         temp_html = tmp_path / "temp.html"
         temp_html.write_text("test")
@@ -173,9 +146,6 @@ class TestCleanupTempFiles:
     @patch("src.farmer_cli.utils.cleanup.logger")
     def test_cleanup_temp_files_unlink_error(self, mock_logger, tmp_path, monkeypatch):
         """Test cleanup when unlink fails."""
-        from pathlib import Path
-        from src.farmer_cli.utils import cleanup
-
         # Create a temp file
         temp_html = tmp_path / "temp.html"
         temp_html.write_text("test")
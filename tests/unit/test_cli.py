@@ -11,10 +11,13 @@ Tests cover:
 Requirements: 9.1, 9.3
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from click import Abort
+from click import ClickException
 from click.testing import CliRunner
 
 from farmer_cli.cli import QuietContext
@@ -27,9 +30,9 @@ from farmer_cli.cli import main
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Create a Click CLI test runner."""
+    """Create a Click CLI test runner shared by the whole module."""
     return CliRunner()
 
 
@@ -40,6 +43,44 @@ def mock_ytdlp_wrapper():
     return wrapper
 
 
+@pytest.fixture
+def mocked_download(tmp_path):
+    """Patch the download command's services to fetch a fake video into tmp_path."""
+    video_info = MagicMock()
+    video_info.title = "Test Video"
+    video_info.uploader = "Test Channel"
+    video_info.duration = 300
+    video_info.formats = []
+
+    video_format = MagicMock()
+    video_format.format_id = "22"
+    video_format.resolution = "1280x720"
+    video_format.extension = "mp4"
+
+    # Create the output file so stat() works
+    output_file = tmp_path / "video.mp4"
+    output_file.write_text("fake video")
+
+    with patch("farmer_cli.cli.YtdlpWrapper") as wrapper_class, \
+         patch("farmer_cli.cli.FormatSelector") as selector_class, \
+         patch("farmer_cli.cli.PreferencesService") as prefs_class, \
+         patch("farmer_cli.cli.DownloadManager"):
+
+        wrapper = wrapper_class.return_value
+        wrapper.extract_info.return_value = video_info
+        wrapper.download.return_value = str(output_file)
+
+        selector_class.return_value.get_best_format.return_value = video_format
+        prefs_class.return_value.get.return_value = str(tmp_path)
+
+        yield SimpleNamespace(
+            wrapper=wrapper,
+            video_info=video_info,
+            video_format=video_format,
+            output_file=output_file,
+        )
+
+
 # ---------------------------------------------------------------------------
 # QuietContext Tests
 # ---------------------------------------------------------------------------
@@ -99,16 +140,10 @@ class TestQuietContext:
 class TestVersionFlag:
     """Tests for --version flag."""
 
-    def test_version_short_flag(self, runner):
-        """Test -V flag shows version."""
-        result = runner.invoke(cli, ["-V"])
-
-        assert result.exit_code == 0
-        assert "farmer-cli version" in result.output
-
-    def test_version_long_flag(self, runner):
-        """Test --version flag shows version."""
-        result = runner.invoke(cli, ["--version"])
+    @pytest.mark.parametrize("flag", ["-V", "--version"])
+    def test_version_flag(self, runner, flag):
+        """Test -V and --version show version."""
+        result = runner.invoke(cli, [flag])
 
         assert result.exit_code == 0
         assert "farmer-cli version" in result.output
@@ -149,15 +184,10 @@ class TestHelpFlag:
 class TestQuietMode:
     """Tests for --quiet flag."""
 
-    def test_quiet_flag_accepted(self, runner):
-        """Test -q flag is accepted."""
-        result = runner.invoke(cli, ["-q", "--version"])
-
-        assert result.exit_code == 0
-
-    def test_quiet_long_flag_accepted(self, runner):
-        """Test --quiet flag is accepted."""
-        result = runner.invoke(cli, ["--quiet", "--version"])
+    @pytest.mark.parametrize("flag", ["-q", "--quiet"])
+    def test_quiet_flag_accepted(self, runner, flag):
+        """Test -q and --quiet are accepted."""
+        result = runner.invoke(cli, [flag, "--version"])
 
         assert result.exit_code == 0
 
@@ -192,19 +222,13 @@ class TestDownloadCommand:
         assert result.exit_code != 0
         assert "Missing argument" in result.output or "URL" in result.output
 
-    def test_download_format_option(self, runner):
-        """Test download accepts --format option."""
-        # Just verify the option is recognized
+    def test_download_help_options(self, runner):
+        """Test download accepts --format and --output options."""
+        # Just verify the options are recognized
         result = runner.invoke(cli, ["download", "--help"])
 
         assert "--format" in result.output
         assert "-f" in result.output
-
-    def test_download_output_option(self, runner):
-        """Test download accepts --output option."""
-        # Just verify the option is recognized
-        result = runner.invoke(cli, ["download", "--help"])
-
         assert "--output" in result.output
         assert "-o" in result.output
 
@@ -233,63 +257,22 @@ class TestInteractiveCommand:
 class TestMainFunction:
     """Tests for main() entry point."""
 
-    def test_main_returns_zero_on_success(self):
-        """Test main returns 0 on success."""
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.return_value = None
-
-            result = main()
-
-            assert result == 0
-
-    def test_main_returns_exit_code_on_system_exit(self):
-        """Test main returns exit code from SystemExit."""
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.side_effect = SystemExit(42)
-
-            result = main()
-
-            assert result == 42
-
-    def test_main_returns_one_on_click_exception(self):
-        """Test main returns exit code from ClickException."""
-        from click import ClickException
-
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.side_effect = ClickException("test error")
-
-            result = main()
-
-            assert result == 1
-
-    def test_main_returns_one_on_abort(self):
-        """Test main returns 1 on click.Abort."""
-        from click import Abort
-
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.side_effect = Abort()
-
-            result = main()
-
-            assert result == 1
-
-    def test_main_returns_130_on_keyboard_interrupt(self):
-        """Test main returns 130 on KeyboardInterrupt."""
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.side_effect = KeyboardInterrupt()
-
-            result = main()
-
-            assert result == 130
-
-    def test_main_returns_one_on_exception(self):
-        """Test main returns 1 on unexpected exception."""
-        with patch("farmer_cli.cli.cli") as mock_cli:
-            mock_cli.side_effect = Exception("unexpected error")
-
-            result = main()
-
-            assert result == 1
+    @pytest.mark.parametrize(
+        ("side_effect", "expected"),
+        [
+            (None, 0),
+            (SystemExit(42), 42),
+            (ClickException("test error"), 1),
+            (Abort(), 1),
+            (KeyboardInterrupt(), 130),
+            (Exception("unexpected error"), 1),
+        ],
+        ids=["success", "system_exit", "click_exception", "abort", "keyboard_interrupt", "exception"],
+    )
+    def test_main_exit_codes(self, side_effect, expected):
+        """Test main maps the CLI outcome to its exit code."""
+        with patch("farmer_cli.cli.cli", side_effect=side_effect):
+            assert main() == expected
 
 
 # ---------------------------------------------------------------------------
@@ -323,81 +306,23 @@ class TestCLIGroup:
 class TestDownloadCommandWithMocks:
     """Integration tests for download command with mocked services."""
 
-    def test_download_with_valid_url_mocked(self, runner, tmp_path):
+    def test_download_with_valid_url_mocked(self, runner, mocked_download):
         """Test download with valid URL (mocked services)."""
-        mock_video_info = MagicMock()
-        mock_video_info.title = "Test Video"
-        mock_video_info.uploader = "Test Channel"
-        mock_video_info.duration = 300
-        mock_video_info.formats = []
-
-        mock_format = MagicMock()
-        mock_format.format_id = "22"
-        mock_format.resolution = "1280x720"
-        mock_format.extension = "mp4"
-
-        with patch("farmer_cli.cli.YtdlpWrapper") as mock_wrapper_class, \
-             patch("farmer_cli.cli.FormatSelector") as mock_selector_class, \
-             patch("farmer_cli.cli.PreferencesService") as mock_prefs_class, \
-             patch("farmer_cli.cli.DownloadManager"):
-
-            mock_wrapper = mock_wrapper_class.return_value
-            mock_wrapper.extract_info.return_value = mock_video_info
-            mock_wrapper.download.return_value = str(tmp_path / "video.mp4")
-
-            mock_selector = mock_selector_class.return_value
-            mock_selector.get_best_format.return_value = mock_format
-
-            mock_prefs = mock_prefs_class.return_value
-            mock_prefs.get.return_value = str(tmp_path)
-
-            # Create the output file so stat() works
-            (tmp_path / "video.mp4").write_text("fake video")
-
-            result = runner.invoke(
-                cli,
-                ["download", "https://youtube.com/watch?v=test123"],
-            )
+        result = runner.invoke(
+            cli,
+            ["download", "https://youtube.com/watch?v=test123"],
+        )
 
-            # Should succeed with mocked services
-            assert "Download complete" in result.output or result.exit_code == 0
+        # Should succeed with mocked services
+        assert "Download complete" in result.output or result.exit_code == 0
 
-    def test_download_quiet_mode_suppresses_output(self, runner, tmp_path):
+    def test_download_quiet_mode_suppresses_output(self, runner, mocked_download):
         """Test download in quiet mode suppresses output."""
-        mock_video_info = MagicMock()
-        mock_video_info.title = "Test Video"
-        mock_video_info.uploader = "Test Channel"
-        mock_video_info.duration = 300
-        mock_video_info.formats = []
-
-        mock_format = MagicMock()
-        mock_format.format_id = "22"
-        mock_format.resolution = "1280x720"
-        mock_format.extension = "mp4"
-
-        with patch("farmer_cli.cli.YtdlpWrapper") as mock_wrapper_class, \
-             patch("farmer_cli.cli.FormatSelector") as mock_selector_class, \
-             patch("farmer_cli.cli.PreferencesService") as mock_prefs_class, \
-             patch("farmer_cli.cli.DownloadManager"):
-
-            mock_wrapper = mock_wrapper_class.return_value
-            mock_wrapper.extract_info.return_value = mock_video_info
-            mock_wrapper.download.return_value = str(tmp_path / "video.mp4")
-
-            mock_selector = mock_selector_class.return_value
-            mock_selector.get_best_format.return_value = mock_format
-
-            mock_prefs = mock_prefs_class.return_value
-            mock_prefs.get.return_value = str(tmp_path)
-
-            # Create the output file
-            (tmp_path / "video.mp4").write_text("fake video")
-
-            result = runner.invoke(
-                cli,
-                ["-q", "download", "https://youtube.com/watch?v=test123"],
-            )
-
-            # In quiet mode, output should be minimal
-            # The test verifies the command runs without error
-            assert result.exit_code == 0 or "Error" not in result.output
+        result = runner.invoke(
+            cli,
+            ["-q", "download", "https://youtube.com/watch?v=test123"],
+        )
+
+        # In quiet mode, output should be minimal
+        # The test verifies the command runs without error
+        assert result.exit_code == 0 or "Error" not in result.output